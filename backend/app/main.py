@@ -1,17 +1,53 @@
-import json
+import asyncio
 import os
 import re
-from collections import Counter
+import tempfile
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
+from heapq import nlargest
 from io import BytesIO
-from typing import List
+from operator import itemgetter
+from threading import Lock
+from typing import List, Optional
 
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, File, Form, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 from pypdf import PdfReader
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import marisa_trie
+except ImportError:
+    marisa_trie = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 
 class MatchResult(BaseModel):
     score: float
@@ -30,7 +66,7 @@ class AnalyzeRequest(BaseModel):
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-STOP_WORDS = {
+STOP_WORDS = frozenset({
     "the",
     "and",
     "for",
@@ -59,38 +95,259 @@ STOP_WORDS = {
     "job",
     "role",
     "responsibilities",
-}
+})
+
+# Patterns compiled once at import so the per-request hot paths skip the
+# regex-cache lookup entirely.
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9+#\-.]*")
+_METRIC_RE = re.compile(r"\d+%|\$\d+|\d+\s*(?:users|clients|customers|projects)")
+_BULLET_VERB_RE = re.compile(
+    r"^(?:developed|created|implemented|designed|built|managed|led|improved|optimized)\b",
+    re.IGNORECASE,
+)
 
+# Curated skills/tech vocabulary used by the keyword scanner. Multi-word
+# entries are supported because matching is substring-based, not token-based.
+SKILL_VOCAB = (
+    "python", "java", "javascript", "typescript", "c++", "c#", "golang", "go",
+    "rust", "ruby", "php", "swift", "kotlin", "scala", "sql", "nosql", "html",
+    "css", "react", "angular", "vue", "node.js", "nodejs", "express",
+    "django", "flask", "fastapi", "spring", "spring boot", ".net", "rails",
+    "next.js", "graphql", "rest api", "restful", "microservices", "grpc",
+    "aws", "azure", "gcp", "google cloud", "docker", "kubernetes", "terraform",
+    "jenkins", "ci/cd", "git", "github", "gitlab", "linux", "bash",
+    "postgresql", "postgres", "mysql", "mongodb", "redis", "elasticsearch",
+    "kafka", "rabbitmq", "spark", "hadoop", "airflow", "snowflake", "dbt",
+    "pandas", "numpy", "scikit-learn", "tensorflow", "pytorch", "keras",
+    "machine learning", "deep learning", "data science", "data analysis",
+    "data engineering", "nlp", "computer vision", "llm", "langchain", "openai",
+    "etl", "tableau", "power bi", "excel", "agile", "scrum", "jira", "devops",
+    "project management", "product management", "unit testing", "selenium",
+    "pytest", "mern", "mean", "full stack", "frontend", "backend", "api",
+)
 
-def extract_keywords(text: str, max_keywords: int = 40) -> List[str]:
-    words = re.findall(r"[A-Za-z][A-Za-z0-9+#\-.]*", text.lower())
+# Vocabulary membership structure: a MARISA trie keeps lookups O(|key|)
+# with a fraction of the memory of a Python set once the vocab grows.
+if marisa_trie is not None:
+    _SKILL_LOOKUP = marisa_trie.Trie(SKILL_VOCAB)
+else:
+    _SKILL_LOOKUP = frozenset(SKILL_VOCAB)
+
+# Characters that can appear inside a matched keyword; used to reject
+# substring hits that fall mid-word (e.g. "java" inside "javascript").
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+# ASCII fast path for the fallback tokenizer: translate() maps every
+# non-token byte to a space in C, then split()/lstrip() reproduce the
+# token-regex semantics (tokens start with a letter) without a regex walk.
+_TOKEN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789+#-.")
+_ASCII_SPLIT_TABLE = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if c not in _TOKEN_CHARS}
+)
+_TOKEN_LSTRIP = "0123456789+#-."
+
+
+def _iter_tokens(lowered: str):
+    if lowered.isascii():
+        for raw in lowered.translate(_ASCII_SPLIT_TABLE).split():
+            token = raw.lstrip(_TOKEN_LSTRIP)
+            if token:
+                yield token
+    else:
+        yield from _TOKEN_RE.findall(lowered)
+
+
+def _build_skill_automaton():
+    """Build the Aho-Corasick automaton over SKILL_VOCAB once at import."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for skill in SKILL_VOCAB:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AC = _build_skill_automaton()
+
+# Phrases/words scanned for the verification notes, tagged by category so a
+# single automaton pass can tally all of them at once.
+_COMMON_PHRASES = ("responsible for", "duties include", "required skills")
+_VAGUE_WORDS = ("some", "various", "several", "many", "extensive")
+
+
+def _build_verify_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase in _COMMON_PHRASES:
+        automaton.add_word(phrase, ("copied", phrase))
+    for word in _VAGUE_WORDS:
+        automaton.add_word(word, ("vague", word))
+    automaton.make_automaton()
+    return automaton
+
+
+_VERIFY_AC = _build_verify_automaton()
+
+# Fallback multi-pattern scans: one precompiled alternation per category so
+# the non-automaton path still walks each document once per category rather
+# than once per term.
+_COPIED_RE = re.compile("|".join(re.escape(p) for p in _COMMON_PHRASES))
+_VAGUE_RE = re.compile("|".join(re.escape(w) for w in _VAGUE_WORDS))
+
+
+def _verify_hits(lowered: str) -> dict:
+    """One linear scan collecting the distinct terms present per category."""
+    hits: dict = {"copied": set(), "vague": set()}
+    for _, (category, term) in _VERIFY_AC.iter(lowered):
+        hits[category].add(term)
+    return hits
+
+
+def _is_whole_word(lowered: str, start: int, end: int) -> bool:
+    before_ok = start == 0 or lowered[start - 1] not in _WORD_CHARS
+    after_ok = end + 1 >= len(lowered) or lowered[end + 1] not in _WORD_CHARS
+    return before_ok and after_ok
+
+
+def _top_k(counts: "Counter[str]", k: int) -> List[str]:
+    """Top-k keywords by count: O(U log k) heap selection, no full sort."""
+    return [w for w, _ in nlargest(k, counts.items(), key=itemgetter(1))]
+
+
+def _tokenize_lower(lowered: str) -> "Counter[str]":
+    """Single tokenization pass over an already-lowercased document."""
+    # Tokenization with stopword filtering. Known vocabulary entries always
+    # survive, so short skills like "go" are not dropped.
     counts: Counter[str] = Counter(
-        w for w in words if len(w) > 2 and w not in STOP_WORDS
+        w
+        for w in _iter_tokens(lowered)
+        if w in _SKILL_LOOKUP or (len(w) > 2 and w not in STOP_WORDS)
     )
-    return [w for w, _ in counts.most_common(max_keywords)]
+
+    # Layer the automaton's vocabulary hits on top (max per key, so shared
+    # single-word skills are not double counted). This adds multi-word
+    # entries like "machine learning" that the tokenizer cannot produce,
+    # while keeping every document in the same keyword space.
+    if _SKILL_AC is not None:
+        counts |= Counter(
+            kw
+            for end, kw in _SKILL_AC.iter(lowered)
+            if _is_whole_word(lowered, end - len(kw) + 1, end)
+        )
+    return counts
+
+
+def _tokenize(text: str) -> "Counter[str]":
+    return _tokenize_lower(text.lower())
+
+
+def extract_keywords(text: str, max_keywords: int = 40) -> List[str]:
+    return _top_k(_tokenize(text), max_keywords)
+
+
+def _bullet_masks_arrow(stripped_lines: List[str]):
+    """Compute the marker/verb line masks with Arrow's C string kernels."""
+    arr = pa.array(stripped_lines, type=pa.string())
+    marker_mask = pc.or_(
+        pc.or_(pc.starts_with(arr, "•"), pc.starts_with(arr, "-")),
+        pc.starts_with(arr, "*"),
+    )
+    verb_mask = pc.and_(
+        pc.and_(
+            pc.greater(pc.utf8_length(arr), 20),
+            pc.invert(pc.match_substring_regex(arr, r"^[A-Z]")),
+        ),
+        pc.match_substring_regex(arr, _BULLET_VERB_RE.pattern, ignore_case=True),
+    )
+    return marker_mask.to_pylist(), verb_mask.to_pylist()
 
 
 def extract_bullet_points(text: str) -> List[str]:
     """Extract bullet points from resume text."""
+    stripped_lines = [line.strip() for line in text.split("\n")]
+
+    if pc is not None:
+        # Batched path: both line filters run vectorized in C, and only the
+        # surviving candidate lines are touched again in Python.
+        marker_mask, verb_mask = _bullet_masks_arrow(stripped_lines)
+    else:
+        marker_mask = [s.startswith(("•", "-", "*")) for s in stripped_lines]
+        verb_mask = [
+            len(s) > 20 and not s[:1].isupper() and bool(_BULLET_VERB_RE.match(s))
+            for s in stripped_lines
+        ]
+
     bullets = []
-    # Look for lines starting with bullet markers or dashes
-    lines = text.split("\n")
-    for line in lines:
-        stripped = line.strip()
-        if stripped and (stripped.startswith("•") or stripped.startswith("-") or stripped.startswith("*")):
+    for stripped, is_marker, is_verb in zip(stripped_lines, marker_mask, verb_mask):
+        if is_marker:
             bullet = stripped.lstrip("•-*").strip()
             if len(bullet) > 10:  # Only meaningful bullets
                 bullets.append(bullet)
-        elif stripped and len(stripped) > 20 and not stripped[0].isupper() and not stripped.startswith(" "):
-            # Also catch lines that look like bullets (short, action-oriented)
-            if any(stripped.lower().startswith(verb) for verb in ["developed", "created", "implemented", "designed", "built", "managed", "led", "improved", "optimized"]):
-                bullets.append(stripped)
-    return bullets[:15]  # Limit to first 15 bullets
+        elif is_verb:
+            # Lines that look like bullets (short, action-oriented)
+            bullets.append(stripped)
+        if len(bullets) == 15:  # Limit to first 15 bullets
+            break
+    return bullets
+
+
+class _LRUCache:
+    """Small thread-safe LRU cache for per-request analysis results."""
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[bytes, MatchResult]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: bytes) -> Optional[MatchResult]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: bytes, value: MatchResult) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+def _cache_key(resume_text: str, job_description: str, model: str) -> bytes:
+    payload = "\x00".join((resume_text, job_description, model))
+    return sha256(payload.encode("utf-8")).digest()
+
+
+_HEURISTIC_CACHE = _LRUCache(maxsize=1024)
 
 
 def heuristic_analysis(request: AnalyzeRequest) -> MatchResult:
-    jd_keywords = extract_keywords(request.job_description)
-    resume_keywords = set(extract_keywords(request.resume_text, max_keywords=120))
+    # The heuristic is deterministic in its two inputs, so repeat
+    # submissions are served from the LRU keyed on their digests.
+    key = _cache_key(request.resume_text, request.job_description, "heuristic")
+    cached = _HEURISTIC_CACHE.get(key)
+    if cached is not None:
+        return cached
+    result = _heuristic_core(request)
+    _HEURISTIC_CACHE.put(key, result)
+    return result
+
+
+def _heuristic_core(request: AnalyzeRequest) -> MatchResult:
+    # Lowercase each document exactly once; every downstream scan (tokenizer,
+    # verification passes, metric check) reuses the same copy.
+    resume_lower = request.resume_text.lower()
+    jd_lower = request.job_description.lower()
+
+    # One tokenizer pass per document; the JD top-40 and the resume
+    # membership set both derive from the same Counters.
+    jd_counts = _tokenize_lower(jd_lower)
+    resume_counts = _tokenize_lower(resume_lower)
+    jd_keywords = _top_k(jd_counts, 40)
+    resume_keywords = resume_counts.keys()
 
     matched = [k for k in jd_keywords if k in resume_keywords]
     missing = [k for k in jd_keywords if k not in resume_keywords]
@@ -140,12 +397,21 @@ def heuristic_analysis(request: AnalyzeRequest) -> MatchResult:
 
     # Generate specific verification notes based on resume content
     verification_notes = []
-    resume_lower = request.resume_text.lower()
-    jd_lower = request.job_description.lower()
-    
+
+    # Tally copied phrases and vague words in one pass per document when the
+    # automaton is available, instead of one substring search per term.
+    if _VERIFY_AC is not None:
+        resume_hits = _verify_hits(resume_lower)
+        jd_hits = _verify_hits(jd_lower)
+        copied_count = len(resume_hits["copied"] & jd_hits["copied"])
+        vague_count = len(resume_hits["vague"])
+    else:
+        copied_count = len(
+            set(_COPIED_RE.findall(resume_lower)) & set(_COPIED_RE.findall(jd_lower))
+        )
+        vague_count = len(set(_VAGUE_RE.findall(resume_lower)))
+
     # Check for potential copied language
-    common_phrases = ["responsible for", "duties include", "required skills"]
-    copied_count = sum(1 for phrase in common_phrases if phrase in resume_lower and phrase in jd_lower)
     if copied_count > 2:
         verification_notes.append(
             "Warning: Your resume contains phrases that appear copied directly from the job description. "
@@ -153,7 +419,7 @@ def heuristic_analysis(request: AnalyzeRequest) -> MatchResult:
         )
     
     # Check for missing metrics
-    has_numbers = bool(re.search(r'\d+%|\$\d+|\d+\s*(users|clients|customers|projects)', resume_lower))
+    has_numbers = bool(_METRIC_RE.search(resume_lower))
     if not has_numbers:
         verification_notes.append(
             "Your resume lacks quantifiable metrics (percentages, dollar amounts, user counts). "
@@ -161,8 +427,6 @@ def heuristic_analysis(request: AnalyzeRequest) -> MatchResult:
         )
     
     # Check for vague claims
-    vague_words = ["some", "various", "several", "many", "extensive"]
-    vague_count = sum(1 for word in vague_words if word in resume_lower)
     if vague_count > 3:
         verification_notes.append(
             "Replace vague terms like 'some', 'various', 'several' with specific numbers or concrete examples."
@@ -184,17 +448,69 @@ def heuristic_analysis(request: AnalyzeRequest) -> MatchResult:
     )
 
 
-def ai_analysis(request: AnalyzeRequest) -> MatchResult:
-    """
-    AI-powered deep analysis using OpenAI (via langchain-openai).
-    Falls back to heuristic logic if anything goes wrong.
-    """
-    if not OPENAI_API_KEY:
-        return heuristic_analysis(request)
-
-    try:
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
-        prompt = """
+LLM_MODEL = "gpt-4o-mini"
+
+# Rough per-document budget for LLM input; long PDF dumps get condensed to
+# their most JD-relevant sentences before the prompt is built.
+_LLM_INPUT_TOKEN_BUDGET = 3000
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+try:
+    _TIKTOKEN_ENCODING = tiktoken.encoding_for_model(LLM_MODEL) if tiktoken else None
+except Exception:
+    _TIKTOKEN_ENCODING = None
+
+
+def _token_len(text: str) -> int:
+    if _TIKTOKEN_ENCODING is not None:
+        return len(_TIKTOKEN_ENCODING.encode(text))
+    # Rough heuristic when tiktoken is unavailable: ~4 chars per token.
+    return max(1, len(text) // 4)
+
+
+def _truncate_to_budget(text: str, budget: int) -> str:
+    if _TIKTOKEN_ENCODING is not None:
+        tokens = _TIKTOKEN_ENCODING.encode(text)
+        return _TIKTOKEN_ENCODING.decode(tokens[:budget])
+    return text[: budget * 4]
+
+
+def _condense(text: str, jd_keywords: List[str], budget: int) -> str:
+    """Trim a document to its most keyword-relevant sentences within budget."""
+    if _token_len(text) <= budget:
+        return text
+
+    sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(text) if s.strip()]
+    if not sentences:
+        return _truncate_to_budget(text, budget)
+    keyword_set = set(jd_keywords)
+
+    def relevance(sentence: str) -> int:
+        return sum(c for kw, c in _tokenize(sentence).items() if kw in keyword_set)
+
+    ranked = sorted(range(len(sentences)), key=lambda i: relevance(sentences[i]), reverse=True)
+    kept: List[int] = []
+    used = 0
+    for idx in ranked:
+        cost = _token_len(sentences[idx])
+        if used + cost > budget:
+            # An oversized sentence should not end selection; smaller,
+            # lower-ranked sentences can still fill the budget.
+            continue
+        kept.append(idx)
+        used += cost
+    if not kept:
+        # Every sentence alone overflows the budget (e.g. one huge
+        # unpunctuated line from a PDF dump): hard-truncate the top one
+        # rather than sending the model an empty document.
+        return _truncate_to_budget(sentences[ranked[0]], budget)
+    # Preserve original document order for the surviving sentences.
+    return "\n".join(sentences[idx] for idx in sorted(kept))
+
+# Kept as a byte-identical module-level constant and sent as the system
+# message so provider-side prompt caching can reuse the encoded prefix.
+PROMPT_INSTRUCTIONS = """
 You are an ATS-style resume screening assistant.
 Compare the candidate's RESUME to the JOB DESCRIPTION.
 Return a STRICT JSON object with these keys:
@@ -218,16 +534,51 @@ Return a STRICT JSON object with these keys:
 
 Do not include any text outside the JSON. No explanations.
 """
-        user_block = f"JOB DESCRIPTION:\n{request.job_description}\n\nRESUME:\n{request.resume_text}"
 
-        response = llm.invoke(prompt + "\n\n" + user_block)
+
+_LLM_CACHE = _LRUCache(maxsize=1024)
+
+
+def ai_analysis(request: AnalyzeRequest) -> MatchResult:
+    """
+    AI-powered deep analysis using OpenAI (via langchain-openai).
+    Falls back to heuristic logic if anything goes wrong.
+    """
+    if not OPENAI_API_KEY:
+        return heuristic_analysis(request)
+
+    cache_key = _cache_key(request.resume_text, request.job_description, LLM_MODEL)
+    cached = _LLM_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        llm = ChatOpenAI(
+            model=LLM_MODEL,
+            temperature=0.1,
+            max_tokens=800,
+            model_kwargs={"response_format": {"type": "json_object"}},
+        )
+        jd_keywords = _top_k(_tokenize(request.job_description), 40)
+        job_description = _condense(
+            request.job_description, jd_keywords, _LLM_INPUT_TOKEN_BUDGET
+        )
+        resume_text = _condense(request.resume_text, jd_keywords, _LLM_INPUT_TOKEN_BUDGET)
+        user_block = f"JOB DESCRIPTION:\n{job_description}\n\nRESUME:\n{resume_text}"
+
+        response = llm.invoke(
+            [
+                SystemMessage(content=PROMPT_INSTRUCTIONS),
+                HumanMessage(content=user_block),
+            ]
+        )
         content = response.content if isinstance(response.content, str) else str(response.content)
-        data = json.loads(content)
+        data = orjson.loads(content)
 
         score_raw = float(data.get("score", 0.0))
         score = round(max(0.0, min(100.0, score_raw)), 1)
 
-        return MatchResult(
+        result = MatchResult(
             score=score,
             matched_skills=[str(x) for x in data.get("matched_keywords", [])],
             missing_skills=[str(x) for x in data.get("missing_keywords", [])],
@@ -235,11 +586,60 @@ Do not include any text outside the JSON. No explanations.
             rewritten_bullets=[str(x) for x in data.get("rewritten_bullets", [])],
             verification_notes=[str(x) for x in data.get("verification_notes", [])],
         )
+        _LLM_CACHE.put(cache_key, result)
+        return result
     except Exception:
         return heuristic_analysis(request)
 
 
-app = FastAPI(title="Multi-Agent Resume Optimization & Job Matching API")
+# PDF parsing is CPU-bound, so it runs in a process pool rather than on the
+# event loop; the pool is created lazily to keep worker start-up cheap.
+_PDF_POOL: Optional[ProcessPoolExecutor] = None
+_PDF_POOL_LOCK = Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is None:
+            _PDF_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _PDF_POOL
+
+
+def _count_pages(pdf_bytes: bytes) -> int:
+    if pdfium is not None:
+        return len(pdfium.PdfDocument(pdf_bytes))
+    return len(PdfReader(BytesIO(pdf_bytes)).pages)
+
+
+def _extract_page(pdf_bytes: bytes, page_idx: int) -> str:
+    # Prefer the PDFium-backed extractor (native library); pypdf's
+    # pure-Python extract_text stays as the fallback.
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_bytes)
+        return pdf[page_idx].get_textpage().get_text_bounded() or ""
+    reader = PdfReader(BytesIO(pdf_bytes))
+    return reader.pages[page_idx].extract_text() or ""
+
+
+async def _extract_pdf_text(pdf_bytes: bytes) -> str:
+    """Extract all page text, sharding pages across the process pool."""
+    loop = asyncio.get_running_loop()
+    pool = _get_pdf_pool()
+    num_pages = await loop.run_in_executor(pool, _count_pages, pdf_bytes)
+    pages_text = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, _extract_page, pdf_bytes, i)
+            for i in range(num_pages)
+        )
+    )
+    return "\n".join(pages_text)
+
+
+app = FastAPI(
+    title="Multi-Agent Resume Optimization & Job Matching API",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -273,27 +673,42 @@ async def analyze_resume_upload(
     Analyze an uploaded resume file plus job description text.
     Supports PDF (preferred) and falls back to UTF-8 text decoding.
     """
-    content_bytes = await resume_file.read()
     resume_text = ""
 
-    if resume_file.content_type == "application/pdf" or resume_file.filename.lower().endswith(
-        ".pdf"
-    ):
-        try:
-            reader = PdfReader(BytesIO(content_bytes))
-            pages_text = [page.extract_text() or "" for page in reader.pages]
-            resume_text = "\n".join(pages_text)
-        except Exception:
-            resume_text = ""
-
-    if not resume_text:
-        # Fallback: try to interpret as UTF-8 text
-        try:
-            resume_text = content_bytes.decode("utf-8", errors="ignore")
-        except Exception:
-            resume_text = ""
+    # Stream the upload in chunks into a spooled temp file (spills to disk
+    # past 2MB) instead of buffering the whole body in RAM up front.
+    with tempfile.SpooledTemporaryFile(max_size=2 * 1024 * 1024) as spool:
+        while chunk := await resume_file.read(64 * 1024):
+            spool.write(chunk)
+
+        if resume_file.content_type == "application/pdf" or resume_file.filename.lower().endswith(
+            ".pdf"
+        ):
+            try:
+                spool.seek(0)
+                resume_text = await _extract_pdf_text(spool.read())
+            except Exception:
+                resume_text = ""
+
+        if not resume_text:
+            # Fallback: try to interpret as UTF-8 text
+            try:
+                spool.seek(0)
+                resume_text = spool.read().decode("utf-8", errors="ignore")
+            except Exception:
+                resume_text = ""
 
     request = AnalyzeRequest(resume_text=resume_text, job_description=job_description)
     return ai_analysis(request)
 
 
+
+__all__ = [
+    "app",
+    "MatchResult",
+    "AnalyzeRequest",
+    "extract_keywords",
+    "extract_bullet_points",
+    "heuristic_analysis",
+    "ai_analysis",
+]